@@ -4,18 +4,25 @@ Main script to orchestrate all pricing scrapers and save results.
 """
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List, Optional
 import logging
 
-from scrapers.claude_scraper import ClaudeScraper
-from scrapers.openai_scraper import OpenAIScraper
-from scrapers.gemini_scraper import GeminiScraper
-from scrapers.deepseek_scraper import DeepSeekScraper
-from scrapers.doubao_scraper import DoubaoScraper
+# Provider scrapers (and requests/lxml behind them) are imported lazily
+# in PricingAggregator.scrapers to keep startup cheap
 from scrapers.forex import get_cny_to_usd
 
+if TYPE_CHECKING:
+    from scrapers.base_scraper import Model
+
+try:
+    import orjson
+except ImportError:  # Fall back to stdlib json if orjson is not installed
+    orjson = None
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
@@ -23,6 +30,38 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _json_bytes(obj) -> bytes:
+    """
+    Serialize obj to 2-space indented UTF-8 JSON bytes.
+    Uses orjson when available (serializes straight to bytes), else stdlib json.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False, default=asdict).encode('utf-8')
+
+
+def _json_line(obj) -> bytes:
+    """Serialize obj to a single compact line of UTF-8 JSON (with newline)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+    return json.dumps(obj, ensure_ascii=False, default=asdict).encode('utf-8') + b'\n'
+
+
+def _write_atomic(path: Path, payload: bytes) -> None:
+    """
+    Write payload to a sibling temp file, then rename it over path so
+    readers never see a partially written file.
+    """
+    tmp = path.with_name(path.name + '.tmp')
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+
+
+def _dump_json(obj, path: Path) -> None:
+    """Atomically write obj to path as indented UTF-8 JSON."""
+    _write_atomic(path, _json_bytes(obj))
+
+
 class PricingAggregator:
     """Aggregates pricing data from all LLM providers."""
     
@@ -38,7 +77,10 @@ class PricingAggregator:
         self.history_dir = self.data_dir / 'history'
         self.history_dir.mkdir(exist_ok=True)
         
-        self._scrapers = None  # Built lazily with fresh forex rate
+        # Scrapers (and their HTTP sessions) are reused across runs; only
+        # Doubao's forex rate is refreshed per scrape
+        self._static_scrapers = None  # Built lazily on first use
+        self._doubao_scraper = None  # Built lazily with the current forex rate
         self._icon_sources_dir = Path(__file__).resolve().parent / '.agents' / 'icon_sources'
 
     # Map folder names to provider names used in pricing data
@@ -56,132 +98,174 @@ class PricingAggregator:
         if not self._icon_sources_dir.exists():
             logger.warning(f"Icon sources dir not found: {self._icon_sources_dir}")
             return
-        for subdir in sorted(self._icon_sources_dir.iterdir()):
-            if not subdir.is_dir():
-                continue
-            link_file = subdir / 'link'
-            if not link_file.exists():
-                continue
+        # scandir entries carry d_type, so is_dir() needs no extra stat()
+        with os.scandir(self._icon_sources_dir) as it:
+            subdirs = sorted((e for e in it if e.is_dir()), key=lambda e: e.name)
+        for subdir in subdirs:
             try:
-                url = link_file.read_text(encoding='utf-8').strip()
-                if url:
-                    name = self._PROVIDER_NAMES.get(
-                        subdir.name.lower(),
-                        subdir.name.replace('_', ' ').title()
-                    )
-                    icons[name] = url
+                url = (Path(subdir.path) / 'link').read_text(encoding='utf-8').strip()
+            except FileNotFoundError:
+                continue
             except Exception as e:
                 logger.warning(f"Could not read icon for {subdir.name}: {e}")
+                continue
+            if url:
+                name = self._PROVIDER_NAMES.get(
+                    subdir.name.lower(),
+                    subdir.name.replace('_', ' ').title()
+                )
+                icons[name] = url
         if icons:
             out = self.data_dir / 'provider_icons.json'
-            with open(out, 'w', encoding='utf-8') as f:
-                json.dump(icons, f, indent=2)
+            _dump_json(icons, out)
             logger.info(f"Synced {len(icons)} provider icons to {out}")
         else:
             logger.warning("No icon sources found in .agents/icon_sources/")
 
     @property
     def scrapers(self):
-        """Build scrapers with current forex rate (run at scrape time)."""
-        if self._scrapers is None:
-            cny_to_usd = get_cny_to_usd()
-            self._scrapers = [
+        """
+        All scrapers, built on first access (provider modules are imported
+        here, not at startup). Doubao is built with the current forex rate.
+        """
+        if self._static_scrapers is None:
+            from scrapers.claude_scraper import ClaudeScraper
+            from scrapers.openai_scraper import OpenAIScraper
+            from scrapers.gemini_scraper import GeminiScraper
+            from scrapers.deepseek_scraper import DeepSeekScraper
+            self._static_scrapers = [
                 ClaudeScraper(),
                 OpenAIScraper(),
                 GeminiScraper(),
-                DeepSeekScraper(),
-                DoubaoScraper(cny_to_usd=cny_to_usd)
+                DeepSeekScraper()
             ]
-        return self._scrapers
+        if self._doubao_scraper is None:
+            from scrapers.doubao_scraper import DoubaoScraper
+            self._doubao_scraper = DoubaoScraper(
+                cny_to_usd=get_cny_to_usd(self.data_dir / 'forex_cache.json')
+            )
+        return self._static_scrapers + [self._doubao_scraper]
 
     def scrape_all(self) -> Dict:
         """
         Scrape pricing data from all providers.
-        Fetches fresh forex rate (CNY->USD) before Doubao scrape.
+        Refreshes the forex rate (CNY->USD, cached on disk) before Doubao scrape.
+        Scrapers are I/O-bound and share no state, so they run concurrently
+        in a thread pool; provider order in the result is preserved.
         
         Returns:
             Dictionary containing all pricing data
         """
-        self._scrapers = None  # Force fresh scrapers (new forex rate)
+        # Keep the Doubao scraper (and its pooled connection), just update its rate
+        if self._doubao_scraper is not None:
+            self._doubao_scraper.cny_to_usd = get_cny_to_usd(self.data_dir / 'forex_cache.json')
         results = {
             'scraped_at': datetime.utcnow().isoformat(),
             'providers': []
         }
 
-        for scraper in self.scrapers:
-            try:
-                data = scraper.scrape()
-                results['providers'].append(data)
-                logger.info(f"Successfully scraped {scraper.provider_name}")
-            except Exception as e:
-                logger.error(f"Failed to scrape {scraper.provider_name}: {e}")
-                
+        scrapers = self.scrapers
+        scraped = [None] * len(scrapers)
+        with ThreadPoolExecutor(max_workers=len(scrapers)) as executor:
+            futures = {executor.submit(s.scrape): i for i, s in enumerate(scrapers)}
+            for future in as_completed(futures):
+                scraper = scrapers[futures[future]]
+                try:
+                    scraped[futures[future]] = future.result()
+                    logger.info(f"Successfully scraped {scraper.provider_name}")
+                except Exception as e:
+                    logger.error(f"Failed to scrape {scraper.provider_name}: {e}")
+
+        results['providers'] = [data for data in scraped if data is not None]
+        # Merge all models into single list for unified view (each model
+        # already carries its provider name, so no per-model copy is needed)
+        results['all_models'] = [
+            m for p in results['providers'] for m in p.get('models', [])
+        ]
         return results
         
     def save_data(self, data: Dict):
         """
-        Save pricing data to JSON files.
-        Adds flattened all_models list for unified visualization.
+        Save pricing data (including the all_models list built by
+        scrape_all) to current_pricing.json, and a per-model JSONL
+        snapshot to history/pricing_<date>.jsonl.
         Syncs provider icons from .agents/icon_sources/.
         """
         self.sync_icon_sources()
-        # Merge all models into single list with provider for unified view
-        all_models = []
-        for p in data.get('providers', []):
-            for m in p.get('models', []):
-                all_models.append({**m, 'provider': p.get('provider', '')})
-        data['all_models'] = all_models
 
         # Save current pricing
         current_file = self.data_dir / 'current_pricing.json'
-        with open(current_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        _dump_json(data, current_file)
         logger.info(f"Saved current pricing to {current_file}")
         
-        # Save historical snapshot
+        # Save historical snapshot as JSON Lines: one model per line, tagged
+        # with provider and scrape time, streamed so memory stays flat
         date_str = datetime.utcnow().strftime('%Y-%m-%d')
-        history_file = self.history_dir / f'pricing_{date_str}.json'
-        with open(history_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        history_file = self.history_dir / f'pricing_{date_str}.jsonl'
+        tmp = history_file.with_name(history_file.name + '.tmp')
+        with open(tmp, 'wb') as f:
+            for p in data['providers']:
+                for m in p['models']:
+                    f.write(_json_line({**asdict(m), 'scraped_at': p['scraped_at']}))
+        os.replace(tmp, history_file)
         logger.info(f"Saved historical snapshot to {history_file}")
         
+    @staticmethod
+    def _summary_entry(model: Optional['Model']) -> Optional[Dict]:
+        """Condense an all_models entry to the fields shown in summary.json."""
+        if model is None:
+            return None
+        return {
+            'provider': model.provider,
+            'model': model.model_name,
+            'input_price': model.input_price_per_mtok,
+            'output_price': model.output_price_per_mtok
+        }
+
     def generate_summary(self, data: Dict) -> Dict:
         """
         Generate summary statistics from pricing data.
         
         Args:
-            data: Pricing data
+            data: Pricing data as returned by scrape_all (with all_models)
             
         Returns:
             Summary statistics
         """
+        all_models = data['all_models']
         summary = {
             'total_providers': len(data['providers']),
-            'total_models': sum(len(p['models']) for p in data['providers']),
+            'total_models': len(all_models),
             'cheapest_input': None,
             'cheapest_output': None,
             'most_expensive_input': None,
             'most_expensive_output': None
         }
         
-        all_models = []
-        for provider in data['providers']:
-            for model in provider['models']:
-                all_models.append({
-                    'provider': provider['provider'],
-                    'model': model['model_name'],
-                    'input_price': model['input_price_per_mtok'],
-                    'output_price': model['output_price_per_mtok']
-                })
-        
-        # Filter out free models for min/max calculations
-        paid_models = [m for m in all_models if m['input_price'] > 0]
-        
-        if paid_models:
-            summary['cheapest_input'] = min(paid_models, key=lambda x: x['input_price'])
-            summary['cheapest_output'] = min(paid_models, key=lambda x: x['output_price'])
-            summary['most_expensive_input'] = max(paid_models, key=lambda x: x['input_price'])
-            summary['most_expensive_output'] = max(paid_models, key=lambda x: x['output_price'])
+        # Track all four extremes in one pass, skipping free models.
+        # Strict comparisons keep the first model on ties, as min()/max() did.
+        cheapest_input = cheapest_output = None
+        most_expensive_input = most_expensive_output = None
+        for m in all_models:
+            if m.input_price_per_mtok <= 0:
+                continue
+            if cheapest_input is None:
+                cheapest_input = cheapest_output = m
+                most_expensive_input = most_expensive_output = m
+                continue
+            if m.input_price_per_mtok < cheapest_input.input_price_per_mtok:
+                cheapest_input = m
+            elif m.input_price_per_mtok > most_expensive_input.input_price_per_mtok:
+                most_expensive_input = m
+            if m.output_price_per_mtok < cheapest_output.output_price_per_mtok:
+                cheapest_output = m
+            elif m.output_price_per_mtok > most_expensive_output.output_price_per_mtok:
+                most_expensive_output = m
+
+        summary['cheapest_input'] = self._summary_entry(cheapest_input)
+        summary['cheapest_output'] = self._summary_entry(cheapest_output)
+        summary['most_expensive_input'] = self._summary_entry(most_expensive_input)
+        summary['most_expensive_output'] = self._summary_entry(most_expensive_output)
         
         return summary
 
@@ -199,8 +283,7 @@ def main():
     
     # Save summary
     summary_file = Path('data') / 'summary.json'
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        json.dump(summary, f, indent=2, ensure_ascii=False)
+    _dump_json(summary, summary_file)
 
 
 if __name__ == '__main__':
@@ -3,11 +3,19 @@
 Base scraper class for LLM pricing extraction.
 Provides common functionality for all provider-specific scrapers.
 """
+import hashlib
+import json
+import os
+import random
 import re
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree, html
 from datetime import datetime
 import logging
 import time
@@ -15,6 +23,71 @@ import time
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Patterns used per table cell; compiled once at import time
+_PRICE_NUM_RE = re.compile(r'[\d,]+\.?\d*')
+_PRICE_CLEAN_RE = re.compile(r'[^\d.]')
+_CTX_RE = re.compile(r'(\d+(?:\.\d+)?)\s*([KM])?')
+_MODEL_ID_RE = re.compile(r'[^a-z0-9\-]')
+_CELL_NUM_RE = re.compile(r'[\d.]+')
+# Joins cells for a batched scan; never part of a number, rare in page text
+_CELL_SEP = '\x1f'
+
+# Last fetched copy of each page plus its ETag/Last-Modified validators
+HTTP_CACHE_DIR = Path('data') / 'http_cache'
+# Env var: serve cached pages younger than this many seconds without a
+# request (for local iteration; 0, the default, always revalidates)
+HTTP_CACHE_TTL_ENV = 'SCRAPER_CACHE_TTL'
+
+# Upper bound on a single retry sleep, in seconds
+MAX_BACKOFF = 32
+
+
+def backoff_delay(attempt: int) -> float:
+    """
+    Exponential backoff with up to 1s of random jitter, capped at
+    MAX_BACKOFF, so scrapers retrying together don't hit a host in lockstep.
+    """
+    return min(2 ** attempt + random.random(), MAX_BACKOFF)
+
+
+def env_seconds(name: str, default: int) -> int:
+    """Number of seconds from environment variable name, else default."""
+    try:
+        return int(os.getenv(name, default))
+    except ValueError:
+        logger.warning(f"Ignoring non-integer {name}={os.getenv(name)!r}")
+        return default
+
+
+def stripped_text(el: etree._Element) -> str:
+    """
+    Text of an element with each text node stripped and joined with no
+    separator (what BeautifulSoup's get_text(strip=True) returns), so
+    whitespace between nested tags never ends up in names or ids.
+    """
+    return ''.join(t.strip() for t in el.itertext())
+
+
+@lru_cache(maxsize=1024)
+def _model_id(name: str) -> str:
+    """Memoized body of BaseScraper.model_id_from_name (a pure function of name)."""
+    return _MODEL_ID_RE.sub('-', name.lower().strip()).strip('-')
+
+
+@dataclass(slots=True)
+class Model:
+    """
+    Pricing for a single model. A fixed-layout record (no per-instance dict);
+    orjson serializes it natively at the JSON boundary.
+    """
+    model_name: str
+    model_id: str
+    input_price_per_mtok: float
+    output_price_per_mtok: float
+    context_window: int
+    notes: str
+    provider: str = ''
+
 
 class BaseScraper(ABC):
     """Abstract base class for pricing scrapers."""
@@ -34,28 +107,122 @@ class BaseScraper(ABC):
             'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
         
-    def fetch_page(self, url: str, retries: int = 3) -> Optional[BeautifulSoup]:
+    def _get(self, url: str, retries: int = 3,
+             ttl: Optional[int] = None) -> Optional[Tuple[bytes, str]]:
         """
-        Fetch and parse a webpage.
+        GET a URL, retrying with jittered exponential backoff.
+        If a copy is cached in HTTP_CACHE_DIR, the request is conditional
+        (If-None-Match / If-Modified-Since) and a 304 reuses the cached body.
         
         Args:
             url: URL to fetch
             retries: Number of retry attempts
+            ttl: Reuse a cached copy younger than this many seconds without
+                any request (default: $SCRAPER_CACHE_TTL, else 0)
             
         Returns:
-            BeautifulSoup object or None if failed
+            (body bytes, encoding) or None if all attempts failed
         """
+        key = hashlib.sha1(url.encode('utf-8')).hexdigest()
+        body_path = HTTP_CACHE_DIR / f'{key}.html'
+        meta_path = HTTP_CACHE_DIR / f'{key}.json'
+
+        cached_body, meta, headers = None, {}, {}
+        try:
+            meta = json.loads(meta_path.read_text(encoding='utf-8'))
+            cached_body = body_path.read_bytes()
+        except (OSError, ValueError):
+            meta = {}
+        if ttl is None:
+            ttl = env_seconds(HTTP_CACHE_TTL_ENV, 0)
+        if cached_body is not None and ttl > 0:
+            try:
+                if time.time() - body_path.stat().st_mtime < ttl:
+                    logger.info(f"Using cached copy of {url} (younger than {ttl}s)")
+                    return cached_body, meta.get('encoding') or 'utf-8'
+            except OSError:
+                pass
+        if cached_body is not None:
+            if meta.get('etag'):
+                headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                headers['If-Modified-Since'] = meta['last_modified']
+
         for attempt in range(retries):
             try:
-                response = self.session.get(url, timeout=30)
+                response = self.session.get(url, timeout=30, headers=headers)
+                if response.status_code == 304 and headers:
+                    logger.info(f"{url} not modified; using cached copy")
+                    try:
+                        body_path.touch()  # Revalidated: restart its TTL
+                    except OSError:
+                        pass
+                    return cached_body, meta.get('encoding') or 'utf-8'
                 response.raise_for_status()
-                return BeautifulSoup(response.content, 'lxml')
+                encoding = self._response_encoding(response)
+                self._store_cached(response, encoding, body_path, meta_path, always=ttl > 0)
+                return response.content, encoding
             except Exception as e:
                 logger.error(f"Attempt {attempt + 1} failed for {url}: {e}")
                 if attempt < retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                else:
-                    return None
+                    time.sleep(backoff_delay(attempt))
+        return None
+
+    @staticmethod
+    def _store_cached(response: requests.Response, encoding: str,
+                      body_path: Path, meta_path: Path, always: bool = False) -> None:
+        """Cache a response body if the server sent validators for it (or always)."""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified and not always:
+            return
+        try:
+            body_path.parent.mkdir(parents=True, exist_ok=True)
+            body_path.write_bytes(response.content)
+            meta_path.write_text(json.dumps({
+                'url': response.url,
+                'etag': etag,
+                'last_modified': last_modified,
+                'encoding': encoding
+            }, indent=2), encoding='utf-8')
+        except OSError as e:
+            logger.warning(f"Could not cache {response.url}: {e}")
+
+    @staticmethod
+    def _response_encoding(response: requests.Response) -> str:
+        """
+        Encoding declared in the Content-Type header, else UTF-8.
+        Passing it explicitly skips the parser's charset sniffing (requests
+        itself would assume ISO-8859-1 for text/html without a charset).
+        """
+        if 'charset=' in response.headers.get('Content-Type', '').lower():
+            return response.encoding or 'utf-8'
+        return 'utf-8'
+
+    def fetch_tree(self, url: str, retries: int = 3,
+                   ttl: Optional[int] = None) -> Optional[html.HtmlElement]:
+        """
+        Fetch a webpage and parse it with lxml.html (C parser and traversal;
+        all scrapers only read tables, so no BeautifulSoup tree is needed).
+        
+        Args:
+            url: URL to fetch
+            retries: Number of retry attempts
+            ttl: Max age in seconds of a cached copy to reuse without a request
+            
+        Returns:
+            Root HtmlElement or None if failed
+        """
+        fetched = self._get(url, retries, ttl)
+        if fetched is None:
+            return None
+        content, encoding = fetched
+        try:
+            parser = html.HTMLParser(encoding=encoding)
+            return html.fromstring(content, parser=parser)
+        except (etree.ParserError, LookupError) as e:
+            logger.error(f"Failed to parse {url}: {e}")
+            return None
                     
     @abstractmethod
     def scrape(self) -> Dict:
@@ -79,19 +246,47 @@ class BaseScraper(ABC):
         """
         if not price_str or price_str.strip() in ('-', '—', 'N/A', 'Not available'):
             return 0.0
+        # Fast path for plain amounts like "$5.00" or "0.14 / MTok": digits with
+        # at most one dot parse with float() directly, no regex needed
+        head = price_str.strip().lstrip('$¥€£').replace(',', '').split(maxsplit=1)
+        if head and head[0][:1].isdigit() and head[0].replace('.', '', 1).isdigit():
+            try:
+                return float(head[0])
+            except ValueError:
+                pass
         # Extract first number (handles "$5 / MTok", "$2.00, prompts <= 200k", etc.)
-        match = re.search(r'[\d,]+\.?\d*', price_str.replace(',', ''))
+        match = _PRICE_NUM_RE.search(price_str.replace(',', ''))
         if match:
             try:
                 return float(match.group().replace(',', ''))
             except ValueError:
                 pass
-        cleaned = re.sub(r'[^\d.]', '', price_str)
+        cleaned = _PRICE_CLEAN_RE.sub('', price_str)
         try:
             return float(cleaned) if cleaned else 0.0
         except ValueError:
             return 0.0
 
+    @staticmethod
+    def _batch_extract_numbers(cells: List[str]) -> List[float]:
+        """
+        First number in each cell (e.g. '0.80 ', '2.00 元'), 0.0 if none.
+        The cells are joined with a unit separator and scanned with one
+        finditer, instead of one regex search per cell.
+        """
+        values = [0.0] * len(cells)
+        if not cells:
+            return values
+        ends = list(accumulate(len(c) + 1 for c in cells))  # next cell's offset
+        idx, last = 0, -1
+        for m in _CELL_NUM_RE.finditer(_CELL_SEP.join(cells)):
+            while ends[idx] <= m.start():
+                idx += 1
+            if idx != last:
+                values[idx] = float(m.group())
+                last = idx
+        return values
+
     def parse_context_window(self, text: str) -> int:
         """
         Parse context window from text like "128K", "200K", "1M", "128000".
@@ -102,7 +297,7 @@ class BaseScraper(ABC):
         if not text:
             return 0
         text = str(text).upper().replace(',', '').strip()
-        match = re.search(r'(\d+(?:\.\d+)?)\s*([KM])?', text)
+        match = _CTX_RE.search(text)
         if match:
             num = float(match.group(1))
             unit = match.group(2) or ''
@@ -117,20 +312,21 @@ class BaseScraper(ABC):
         """
         Derive model_id from model name (lowercase, hyphens, no spaces).
         """
-        if not name:
-            return ''
-        return re.sub(r'[^a-z0-9\-]', '-', name.lower().strip()).strip('-')
-            
-    def format_output(self, models: List[Dict]) -> Dict:
+        return _model_id(name) if name else ''
+
+    def format_output(self, models: List[Model]) -> Dict:
         """
         Format scraped data into standardized structure.
+        Tags each model with this provider's name.
         
         Args:
-            models: List of model pricing dictionaries
+            models: List of model pricing records
             
         Returns:
             Formatted pricing data
         """
+        for model in models:
+            model.provider = self.provider_name
         return {
             'provider': self.provider_name,
             'scraped_at': datetime.utcnow().isoformat(),
@@ -4,9 +4,13 @@ Scraper for Anthropic Claude pricing.
 Parses https://platform.claude.com/docs/en/about-claude/pricing
 """
 from typing import Dict, List
-from bs4 import BeautifulSoup
+from lxml import etree, html
 
-from .base_scraper import BaseScraper, logger
+from .base_scraper import BaseScraper, Model, logger, stripped_text
+
+# XPath expressions compiled once at import time
+_WFULL_TABLES = etree.XPath('//table[contains(concat(" ", normalize-space(@class), " "), " w-full ")]')
+_ALL_TABLES = etree.XPath('//table')
 
 
 class ClaudeScraper(BaseScraper):
@@ -25,32 +29,33 @@ class ClaudeScraper(BaseScraper):
         """
         logger.info(f"Scraping {self.provider_name} pricing...")
 
-        soup = self.fetch_page(self.base_url)
-        if not soup:
+        root = self.fetch_tree(self.base_url)
+        if root is None:
             logger.error(f"Failed to fetch {self.provider_name} pricing page")
             return self.format_output([])
 
-        models = self._parse_pricing_table(soup)
+        models = self._parse_pricing_table(root)
         return self.format_output(models)
 
-    def _parse_pricing_table(self, soup: BeautifulSoup) -> List[Dict]:
+    def _parse_pricing_table(self, root: html.HtmlElement) -> List[Model]:
         """
         Find the main Model pricing table (Model | Base Input Tokens | ... | Output Tokens)
         and extract all model rows dynamically.
         """
         models = []
-        tables = soup.find_all('table', class_='w-full')
+        tables = _WFULL_TABLES(root)
         if not tables:
-            tables = soup.find_all('table')
+            tables = _ALL_TABLES(root)
 
         for table in tables:
-            thead = table.find('thead')
-            if not thead:
+            thead = table.find('.//thead')
+            if thead is None:
                 continue
 
-            headers = [th.get_text(strip=True).lower() for th in thead.find_all('th')]
+            headers = [stripped_text(th).lower() for th in thead.iter('th')]
             # Look for the main model pricing table (Base Input + Output columns)
-            if 'base input tokens' not in ' '.join(headers) or 'output tokens' not in ' '.join(headers):
+            header_text = ' '.join(headers)
+            if 'base input tokens' not in header_text or 'output tokens' not in header_text:
                 continue
 
             # Determine column indices
@@ -66,16 +71,16 @@ class ClaudeScraper(BaseScraper):
             if col_base_input is None or col_output is None:
                 continue
 
-            tbody = table.find('tbody')
-            if not tbody:
+            tbody = table.find('.//tbody')
+            if tbody is None:
                 continue
 
-            for tr in tbody.find_all('tr'):
-                cells = tr.find_all('td')
+            for tr in tbody.iter('tr'):
+                cells = tr.findall('td')
                 if len(cells) <= max(col_base_input, col_output):
                     continue
 
-                model_name = cells[col_model].get_text(strip=True)
+                model_name = stripped_text(cells[col_model])
                 # Skip empty rows (e.g. continuation rows in long context table)
                 if not model_name or len(model_name) < 3:
                     continue
@@ -83,8 +88,8 @@ class ClaudeScraper(BaseScraper):
                 if 'token' in model_name.lower() and '$' not in model_name:
                     continue
 
-                input_price = self.normalize_price(cells[col_base_input].get_text())
-                output_price = self.normalize_price(cells[col_output].get_text())
+                input_price = self.normalize_price(cells[col_base_input].text_content())
+                output_price = self.normalize_price(cells[col_output].text_content())
 
                 if input_price == 0 and output_price == 0:
                     continue
@@ -93,14 +98,14 @@ class ClaudeScraper(BaseScraper):
                 if 'deprecated' in model_name.lower():
                     notes.append('Deprecated')
 
-                models.append({
-                    'model_name': model_name,
-                    'model_id': self.model_id_from_name(model_name),
-                    'input_price_per_mtok': round(input_price, 4),
-                    'output_price_per_mtok': round(output_price, 4),
-                    'context_window': 200000,  # Claude standard context
-                    'notes': '; '.join(notes) if notes else 'Base input and output pricing'
-                })
+                models.append(Model(
+                    model_name=model_name,
+                    model_id=self.model_id_from_name(model_name),
+                    input_price_per_mtok=round(input_price, 4),
+                    output_price_per_mtok=round(output_price, 4),
+                    context_window=200000,  # Claude standard context
+                    notes='; '.join(notes) if notes else 'Base input and output pricing'
+                ))
 
             break  # Use first matching table only
 
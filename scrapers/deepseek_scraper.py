@@ -4,9 +4,14 @@ Scraper for DeepSeek pricing.
 Parses https://api-docs.deepseek.com/quick_start/pricing
 """
 from typing import Dict, List
-from bs4 import BeautifulSoup
+from lxml import etree, html
 
-from .base_scraper import BaseScraper, logger
+from .base_scraper import BaseScraper, Model, logger, stripped_text
+
+# XPath expressions compiled once at import time
+_STYLED_TABLES = etree.XPath('//div[contains(@style, "font-size")]//table')
+_ALL_TABLES = etree.XPath('//table')
+_ROW_CELLS = etree.XPath('./td|./th')
 
 
 class DeepSeekScraper(BaseScraper):
@@ -25,15 +30,15 @@ class DeepSeekScraper(BaseScraper):
         """
         logger.info(f"Scraping {self.provider_name} pricing...")
 
-        soup = self.fetch_page(self.base_url)
-        if not soup:
+        root = self.fetch_tree(self.base_url)
+        if root is None:
             logger.error(f"Failed to fetch {self.provider_name} pricing page")
             return self.format_output([])
 
-        models = self._parse_pricing_table(soup)
+        models = self._parse_pricing_table(root)
         return self.format_output(models)
 
-    def _parse_pricing_table(self, soup: BeautifulSoup) -> List[Dict]:
+    def _parse_pricing_table(self, root: html.HtmlElement) -> List[Model]:
         """
         Parse the Model Details table. Structure:
         - Row 1: MODEL | model1 | model2 | ...
@@ -48,43 +53,38 @@ class DeepSeekScraper(BaseScraper):
         price_output = 0.0
 
         # Find table - in div with font-size or in theme-doc-markdown
-        for div in soup.find_all('div', style=lambda s: s and 'font-size' in (s or '')):
-            table = div.find('table')
-            if table:
-                break
-        else:
-            table = soup.find('table')
-
-        if not table:
+        tables = _STYLED_TABLES(root) or _ALL_TABLES(root)
+        if not tables:
             return models
+        table = tables[0]
 
-        rows = table.find_all('tr')
-        for tr in rows:
-            cells = [td.get_text(strip=True) for td in tr.find_all(['td', 'th'])]
+        for tr in table.iter('tr'):
+            cells = _ROW_CELLS(tr)
             if not cells:
                 continue
 
-            first = cells[0].upper().strip()
+            # Classify the row by its first cell; only read the other cells
+            # a row type actually needs
+            first = stripped_text(cells[0]).upper()
             if first == 'MODEL' and len(cells) >= 2:
                 # Header row: MODEL | model1 | model2
-                model_ids = [c.strip() for c in cells[1:] if c and not c.startswith('http')
+                names = (stripped_text(td) for td in cells[1:])
+                model_ids = [c for c in names if c and not c.startswith('http')
                             and 'deepseek-' in c.lower()]
             elif 'CONTEXT' in first and 'LENGTH' in first:
-                ctx_val = cells[-1] if len(cells) > 1 else ''
+                ctx_val = stripped_text(cells[-1]) if len(cells) > 1 else ''
                 context_window = self.parse_context_window(ctx_val) or 128000
             elif 'PRICING' in first and len(cells) < 2:
                 continue  # Standalone PRICING header
             else:
                 # Check any cell for pricing row type (rowspan may put PRICING in first cell)
-                row_text = ' '.join(cells).upper()
-                val = cells[-1] if len(cells) > 1 else cells[0]
-                price_val = self.normalize_price(val)
+                row_text = ' '.join(stripped_text(td) for td in cells).upper()
                 if 'CACHE HIT' in row_text and 'INPUT' in row_text:
-                    price_cache_hit = price_val
+                    price_cache_hit = self.normalize_price(stripped_text(cells[-1]))
                 elif 'CACHE MISS' in row_text:
-                    price_cache_miss = price_val
+                    price_cache_miss = self.normalize_price(stripped_text(cells[-1]))
                 elif 'OUTPUT' in row_text and 'INPUT' not in row_text:
-                    price_output = price_val
+                    price_output = self.normalize_price(stripped_text(cells[-1]))
 
         if not model_ids:
             model_ids = ['deepseek-chat', 'deepseek-reasoner']
@@ -96,22 +96,22 @@ class DeepSeekScraper(BaseScraper):
             name = model_id.replace('-', ' ').title()
 
             if price_cache_miss > 0:
-                models.append({
-                    'model_name': f'{name}',
-                    'model_id': model_id,
-                    'input_price_per_mtok': round(price_cache_miss, 4),
-                    'output_price_per_mtok': round(price_output, 4),
-                    'context_window': context_window,
-                    'notes': 'Cache miss pricing'
-                })
+                models.append(Model(
+                    model_name=f'{name}',
+                    model_id=model_id,
+                    input_price_per_mtok=round(price_cache_miss, 4),
+                    output_price_per_mtok=round(price_output, 4),
+                    context_window=context_window,
+                    notes='Cache miss pricing'
+                ))
             if price_cache_hit > 0:
-                models.append({
-                    'model_name': f'{name} (Cached)',
-                    'model_id': model_id,
-                    'input_price_per_mtok': round(price_cache_hit, 4),
-                    'output_price_per_mtok': round(price_output, 4),
-                    'context_window': context_window,
-                    'notes': 'Cache hit pricing'
-                })
+                models.append(Model(
+                    model_name=f'{name} (Cached)',
+                    model_id=model_id,
+                    input_price_per_mtok=round(price_cache_hit, 4),
+                    output_price_per_mtok=round(price_output, 4),
+                    context_window=context_window,
+                    notes='Cache hit pricing'
+                ))
 
         return models
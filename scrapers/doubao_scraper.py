@@ -8,24 +8,108 @@ loaded dynamically. This scraper tries multiple parsing strategies.
 
 On each run: fetches the page, saves it to data/doubao_snapshot.html,
 then parses from that file (enables inspection and JS-rendered content
-if fetched externally).
+if fetched externally). Tables are streamed from the file with lxml
+iterparse rather than parsed into a full document tree.
 """
 import json
+import mmap
+import os
 import re
 import time
+from collections import deque
+from email.utils import formatdate
+from html import unescape
+from functools import lru_cache
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Any, Optional
-from bs4 import BeautifulSoup
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from lxml import etree
 
-from .base_scraper import BaseScraper, logger
+from .base_scraper import (
+    BaseScraper, Model, backoff_delay, env_seconds, logger, stripped_text
+)
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # Fall back to stdlib json if orjson is not installed
+    _json_loads = json.loads
 
 # Snapshot path: saved on each run, then parsed from file
 DOUBAO_SNAPSHOT_PATH = Path('data') / 'doubao_snapshot.html'
+# A snapshot younger than $DOUBAO_CACHE_TTL seconds (default 1h) is parsed
+# without fetching; DOUBAO_FORCE_REFRESH=1 always fetches
+DOUBAO_CACHE_TTL = 3600
 
 
 # Fallback CNY->USD when forex-python unavailable
 CNY_TO_USD_FALLBACK = 1 / 7.2
 
+# Header words marking a pricing table (输入/输出/元/价格)
+_PRICE_HEADER_KEYWORDS = ('元', '价格', '输入', '输出', 'input', 'output', 'price')
+
+# XPath expressions compiled once at import time
+_TABLE_ROWS = etree.XPath('.//tr')
+_ROW_CELLS = etree.XPath('./td|./th')
+
+# Patterns compiled once at import time (used per table row / cell)
+_YUAN_RE = re.compile(r'[¥￥]?\s*([\d.]+)\s*元?|([\d.]+)\s*元')
+_ROUTER_RE = re.compile(rb'window\._ROUTER_DATA\s*=\s*')
+# Braces and whole JSON string literals (so braces inside strings are skipped)
+_JSON_TOKEN_RE = re.compile(rb'[{}]|"(?:[^"\\]|\\.)*"', re.DOTALL)
+# Markdown table: first pipe row (the header) and the |---|---| separator row
+_MD_HEADER_RE = re.compile(r'^[ \t]*(\|.*)$', re.M)
+_MD_SEP_RE = re.compile(r'^[ \t]*\|[-: \t|]+\|.*$', re.M)
+_BLOCK_SPLIT_RE = re.compile(r'\n\n+')
+# Model name then input/output yuan prices, e.g. "豆包-pro-32k: 0.8元/千tokens, 2.0元/千tokens".
+# Every run is bounded so a long stretch of page text can't make a match
+# attempt backtrack across it.
+_PRICE_PATTERN_RE = re.compile(
+    r'([a-zA-Z0-9\u4e00-\u9fff\-]{1,64}(?:pro|lite|32k|128k)?)\s{0,8}[：:]\s{0,8}'
+    r'([\d.]{1,16})\s{0,8}元[\/／]?[^\d]{0,20}\d{0,8}\s{0,8}[千万]?token[^,，]{0,40}[，,]?\s{0,8}'
+    r'([\d.]{1,16})\s{0,8}元[\/／]?[^\d]{0,20}\d{0,8}\s{0,8}[千万]?token',
+    re.IGNORECASE
+)
+
+
+def _json_object_end(buf, start: int) -> int:
+    """
+    Return the index just past the JSON object that opens at buf[start],
+    tracking {} depth outside string literals, or -1 if it never closes.
+    """
+    depth = 0
+    for m in _JSON_TOKEN_RE.finditer(buf, start):
+        if depth == 0 and m.start() != start:
+            return -1
+        c = buf[m.start()]
+        if c == 0x7B:  # {
+            depth += 1
+        elif c == 0x7D:  # }
+            depth -= 1
+            if depth == 0:
+                return m.end()
+    return -1
+
+
+@lru_cache(maxsize=32)
+def _md_row_re(columns: Tuple[int, ...]) -> 're.Pattern[str]':
+    """
+    Regex matching a markdown table row with at least max(columns) + 1
+    cells, capturing the cells at the given (sorted) indices in order.
+    """
+    cells = ''.join(
+        r'([^|\n]*)\|' if i in columns else r'[^|\n]*\|'
+        for i in range(columns[-1] + 1)
+    )
+    return re.compile(r'^[ \t]*\|' + cells, re.M)
+
+
+@dataclass(slots=True)
+class DoubaoModel(Model):
+    """Doubao model pricing, keeping the original CNY prices alongside USD."""
+    original_currency: str = 'CNY'
+    original_input_price: float = 0.0
+    original_output_price: float = 0.0
+
 
 class DoubaoScraper(BaseScraper):
     """Scraper for Doubao pricing information."""
@@ -46,12 +130,12 @@ class DoubaoScraper(BaseScraper):
         """
         logger.info(f"Scraping {self.provider_name} pricing...")
 
-        soup = self._fetch_and_save_then_parse()
-        if not soup:
+        snapshot_path = self._fetch_and_save()
+        if snapshot_path is None:
             logger.error(f"Failed to fetch or load {self.provider_name} pricing page")
             return self.format_output([])
 
-        models = self._parse_pricing(soup)
+        models = self._parse_pricing(snapshot_path)
         if models:
             result = self.format_output(models)
             result['currency'] = 'USD (converted from CNY)'
@@ -60,27 +144,60 @@ class DoubaoScraper(BaseScraper):
             return result
         return self.format_output([])
 
-    def _fetch_and_save_then_parse(self) -> Optional[BeautifulSoup]:
+    def _fetch_and_save(self) -> Optional[Path]:
         """
-        Fetch the Doubao pricing page, save to data/doubao_snapshot.html,
-        then parse from that file.
+        Fetch the Doubao pricing page and save it to data/doubao_snapshot.html.
+        Skipped while the existing snapshot is younger than DOUBAO_CACHE_TTL.
+        
+        Returns:
+            Snapshot path to parse from (the previous snapshot if the fetch
+            failed), or None if there is none
         """
         snapshot_path = Path(DOUBAO_SNAPSHOT_PATH)
         snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        etag_path = snapshot_path.with_suffix('.etag')
+
+        if os.getenv('DOUBAO_FORCE_REFRESH') != '1':
+            ttl = env_seconds('DOUBAO_CACHE_TTL', DOUBAO_CACHE_TTL)
+            try:
+                if time.time() - snapshot_path.stat().st_mtime < ttl:
+                    logger.info(f"Using fresh snapshot {snapshot_path} (younger than {ttl}s)")
+                    return snapshot_path
+            except OSError:
+                pass
+
+        # Conditional GET against the existing snapshot
+        headers = {}
+        if snapshot_path.exists():
+            try:
+                headers['If-None-Match'] = etag_path.read_text(encoding='utf-8').strip()
+            except OSError:
+                headers['If-Modified-Since'] = formatdate(
+                    snapshot_path.stat().st_mtime, usegmt=True
+                )
 
         # Fetch and save
         for attempt in range(3):
             try:
-                response = self.session.get(self.base_url, timeout=30)
+                response = self.session.get(self.base_url, timeout=30, headers=headers)
+                if response.status_code == 304 and headers:
+                    logger.info(f"{self.base_url} not modified; using existing snapshot")
+                    snapshot_path.touch()  # Revalidated: restart its TTL
+                    break
                 response.raise_for_status()
                 with open(snapshot_path, 'wb') as f:
                     f.write(response.content)
+                etag = response.headers.get('ETag')
+                if etag:
+                    etag_path.write_text(etag, encoding='utf-8')
+                else:
+                    etag_path.unlink(missing_ok=True)
                 logger.info(f"Saved Doubao page to {snapshot_path}")
                 break
             except Exception as e:
                 logger.error(f"Attempt {attempt + 1} failed for {self.base_url}: {e}")
                 if attempt < 2:
-                    time.sleep(2 ** attempt)
+                    time.sleep(backoff_delay(attempt))
                 else:
                     # Fallback: use existing snapshot if fetch failed
                     if snapshot_path.exists():
@@ -90,34 +207,57 @@ class DoubaoScraper(BaseScraper):
 
         if not snapshot_path.exists():
             return None
+        return snapshot_path
 
-        # Read from saved file and parse
-        with open(snapshot_path, 'rb') as f:
-            return BeautifulSoup(f.read(), 'lxml')
-
-    def _parse_pricing(self, soup: BeautifulSoup) -> List[Dict]:
+    def _iter_tables(self, snapshot_path: Path) -> Iterator[etree._Element]:
+        """
+        Stream <table> elements from the snapshot with lxml iterparse instead
+        of building the full document tree; each table is cleared once the
+        caller has moved on, so parsed tables don't accumulate in memory.
+        """
+        try:
+            # Volcengine serves UTF-8; say so rather than have lxml sniff the charset
+            for _, table in etree.iterparse(
+                str(snapshot_path), events=('end',), tag='table', html=True, encoding='utf-8'
+            ):
+                yield table
+                table.clear(keep_tail=True)
+        except etree.LxmlError as e:
+            logger.warning(f"Could not parse tables from {snapshot_path}: {e}")
+
+    def _parse_pricing(self, snapshot_path: Path) -> List[DoubaoModel]:
         """
         Try multiple strategies to extract pricing:
         1. Parse HTML tables with model names and yuan prices
         2. Parse _ROUTER_DATA or other embedded JSON for doc content
         3. Regex search for price patterns (元/千tokens, etc.)
+        Tables are streamed from the snapshot; the router JSON is sliced out
+        of the memory-mapped snapshot bytes (only if its marker is found);
+        the price-pattern scan reads the snapshot text and only runs when
+        it contains 元.
         """
         models = []
 
         # Strategy 1: HTML tables
-        models = self._parse_tables(soup)
+        models = self._parse_tables(self._iter_tables(snapshot_path))
         if models:
             return models
 
-        # Strategy 2: _ROUTER_DATA embedded content
-        models = self._parse_router_data(soup)
+        # Strategy 2: _ROUTER_DATA embedded content, sliced from the snapshot bytes
+        models = self._parse_router_data(snapshot_path)
         if models:
             return models
 
+        # Volcengine serves UTF-8. Read the saved bytes as text directly (no
+        # parse-and-reserialize); unescaping entities leaves text as a parser would
+        raw_html = unescape(snapshot_path.read_bytes().decode('utf-8', errors='replace'))
+
         # Strategy 3: Regex on raw HTML for common Doubao price patterns
-        models = self._parse_price_patterns(str(soup))
-        if models:
-            return models
+        # (every match contains 元, so skip the regex scan without one)
+        if '元' in raw_html:
+            models = self._parse_price_patterns(raw_html)
+            if models:
+                return models
 
         logger.warning(
             f"Could not extract pricing from {self.provider_name} page. "
@@ -125,18 +265,17 @@ class DoubaoScraper(BaseScraper):
         )
         return []
 
-    def _parse_tables(self, soup: BeautifulSoup) -> List[Dict]:
+    def _parse_tables(self, tables: Iterable[etree._Element]) -> List[DoubaoModel]:
         """Parse HTML tables containing model names and prices in 元."""
-        models = []
-        for table in soup.find_all('table'):
-            rows = table.find_all('tr')
-            if len(rows) < 2:
+        rows_cny = []
+        for table in tables:
+            # Sniff the header row before collecting the rest of the table
+            first_row = next(table.iter('tr'), None)
+            if first_row is None:
                 continue
-
-            headers = [th.get_text(strip=True) for th in rows[0].find_all(['th', 'td'])]
+            headers = [stripped_text(th) for th in _ROW_CELLS(first_row)]
             header_str = ' '.join(headers)
-            # Look for price-related headers (输入/输出/元/价格)
-            if not any(k in header_str for k in ['元', '价格', '输入', '输出', 'input', 'output', 'price']):
+            if not any(k in header_str for k in _PRICE_HEADER_KEYWORDS):
                 continue
 
             col_input = col_output = col_model = -1
@@ -153,113 +292,121 @@ class DoubaoScraper(BaseScraper):
                 elif '元' in h and col_output < 0 and col_input >= 0:
                     col_output = i
 
+            if col_input < 0 and col_output < 0:
+                continue  # No price column, so no row can yield a model
             if col_model < 0:
                 col_model = 0
+            min_cells = max(col_model, col_input, col_output) + 1
 
+            rows = _TABLE_ROWS(table)
             for tr in rows[1:]:
-                cells = tr.find_all(['td', 'th'])
-                if len(cells) <= max(col_model, col_input, col_output):
+                cells = _ROW_CELLS(tr)
+                if len(cells) < min_cells:
                     continue
-                model_name = cells[col_model].get_text(strip=True) if col_model >= 0 else ''
-                if not model_name or len(model_name) < 2:
+                model_name = stripped_text(cells[col_model])
+                if len(model_name) < 2:
                     continue
 
-                in_cny = self._extract_yuan(cells[col_input].get_text()) if col_input >= 0 else 0
-                out_cny = self._extract_yuan(cells[col_output].get_text()) if col_output >= 0 else 0
+                in_cny = self._extract_yuan(''.join(cells[col_input].itertext())) if col_input >= 0 else 0
+                out_cny = self._extract_yuan(''.join(cells[col_output].itertext())) if col_output >= 0 else 0
                 if in_cny == 0 and out_cny == 0:
                     continue
 
-                models.append(self._doubao_model(
-                    model_name, in_cny, out_cny
-                ))
-        return models
+                rows_cny.append((model_name, in_cny, out_cny, None))
+        return self._doubao_models(rows_cny)
 
     def _extract_yuan(self, text: str) -> float:
         """Extract price in CNY from text like '0.8元/千tokens' or '¥0.8'."""
         if not text:
             return 0.0
         # Match 0.8 or 0.80 or 5.0 before 元 or ¥
-        match = re.search(r'[¥￥]?\s*([\d.]+)\s*元?|([\d.]+)\s*元', text)
+        match = _YUAN_RE.search(text)
         if match:
             return float(match.group(1) or match.group(2) or 0)
         return self.normalize_price(text)
 
-    def _doubao_model(
-        self, model_name: str, input_cny: float, output_cny: float
-    ) -> Dict:
-        """Build a Doubao model entry with USD conversion."""
-        return {
-            'model_name': model_name,
-            'model_id': self.model_id_from_name(model_name),
-            'input_price_per_mtok': round(input_cny * self.cny_to_usd, 4),
-            'output_price_per_mtok': round(output_cny * self.cny_to_usd, 4),
-            'context_window': 128000,
-            'notes': f'CNY: ¥{input_cny}/¥{output_cny} per 1M tokens',
-            'original_currency': 'CNY',
-            'original_input_price': input_cny,
-            'original_output_price': output_cny
-        }
-
-    def _parse_router_data(self, soup: BeautifulSoup) -> List[Dict]:
+    def _doubao_models(
+        self, rows: Iterable[Tuple[str, float, float, Optional[str]]]
+    ) -> List[DoubaoModel]:
         """
-        Extract doc content from window._ROUTER_DATA.
-        Pricing tables are in loaderData as markdown (|模型名称|条件|输入|输出|).
+        Build Doubao model entries from parsed (name, input CNY, output CNY,
+        model_id or None to derive it from the name) rows, converting to USD
+        in one pass once parsing is done.
         """
-        raw_html = str(soup)
-        match = re.search(r'window\._ROUTER_DATA\s*=\s*', raw_html)
-        if not match:
-            return []
+        rate = self.cny_to_usd
+        return [
+            DoubaoModel(
+                model_name=name,
+                model_id=model_id if model_id is not None else self.model_id_from_name(name),
+                input_price_per_mtok=round(input_cny * rate, 4),
+                output_price_per_mtok=round(output_cny * rate, 4),
+                context_window=128000,
+                notes=f'CNY: ¥{input_cny}/¥{output_cny} per 1M tokens',
+                original_currency='CNY',
+                original_input_price=input_cny,
+                original_output_price=output_cny
+            )
+            for name, input_cny, output_cny, model_id in rows
+        ]
 
+    def _parse_router_data(self, snapshot_path: Path) -> List[DoubaoModel]:
+        """
+        Parse window._ROUTER_DATA from the snapshot.
+        Pricing tables are in loaderData as markdown (|模型名称|条件|输入|输出|).
+        The JSON object is sliced out of the memory-mapped file by brace
+        matching, so only that span is decoded (with orjson when installed).
+        """
         try:
-            rest = raw_html[match.end():]
-            data, _ = json.JSONDecoder().raw_decode(rest)
+            with open(snapshot_path, 'rb') as f, \
+                    mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                router = _ROUTER_RE.search(mm)
+                if not router:
+                    return []
+                start = router.end()
+                end = _json_object_end(mm, start)
+                if end < 0:
+                    logger.debug("_ROUTER_DATA object is not terminated")
+                    return []
+                data = _json_loads(mm[start:end])
             loader = data.get('loaderData') or {}
             md_content = self._find_md_content(loader)
             if md_content:
                 return self._parse_markdown_tables(md_content)
-        except (json.JSONDecodeError, KeyError, ValueError) as e:
+        except (json.JSONDecodeError, KeyError, ValueError, OSError) as e:
             logger.debug(f"Failed to parse _ROUTER_DATA: {e}")
         return []
 
     def _find_md_content(self, loader: Dict) -> str:
-        """Locate curDoc.MDContent in loaderData (key may vary)."""
-        for key, val in loader.items():
-            if isinstance(val, dict):
-                if 'curDoc' in val:
-                    cur = val['curDoc']
-                    if isinstance(cur, dict) and cur.get('MDContent'):
-                        return cur['MDContent']
-                found = self._find_md_content(val)
-                if found:
-                    return found
+        """Locate curDoc.MDContent in loaderData (key may vary), breadth-first."""
+        queue = deque([loader])
+        while queue:
+            node = queue.popleft()
+            if isinstance(node, dict):
+                cur = node.get('curDoc')
+                if isinstance(cur, dict) and cur.get('MDContent'):
+                    return cur['MDContent']
+                queue.extend(node.values())
+            elif isinstance(node, list):
+                queue.extend(node)
         return ''
 
-    def _parse_markdown_tables(self, md: str) -> List[Dict]:
+    def _parse_markdown_tables(self, md: str) -> List[DoubaoModel]:
         """
         Parse markdown tables with 模型名称, 输入, 输出.
         Rows with ^^ continue the previous model. Uses 元/百万token.
         """
         models_dict: Dict[str, Dict] = {}  # model_id -> best (input, output)
-        seen = set()
-
         # Split into table blocks (each starts with |模型名称 or similar)
-        blocks = re.split(r'\n\n+', md)
+        blocks = _BLOCK_SPLIT_RE.split(md)
         for block in blocks:
             if '|模型名称' not in block or '元' not in block or '|---' not in block:
                 continue
-            rows = [r.strip() for r in block.split('\n') if r.strip().startswith('|')]
-            if len(rows) < 2:
+            header = _MD_HEADER_RE.search(block)
+            sep = _MD_SEP_RE.search(block)
+            if not header or not sep or sep.start() == header.start():
                 continue
             # Parse header to get column indices
-            header = rows[0].replace('\\', '')
-            sep_idx = -1
-            for i, r in enumerate(rows):
-                if re.match(r'^\|[-:\s|]+\|', r):
-                    sep_idx = i
-                    break
-            if sep_idx < 0:
-                continue
-            headers = [c.strip() for c in rows[0].split('|')[1:-1]]
+            headers = [c.strip() for c in header.group(1).split('|')[1:-1]]
             col_model = col_input = col_output = -1
             for i, h in enumerate(headers):
                 if '模型' in h or 'model' in h.lower():
@@ -274,23 +421,25 @@ class DoubaoScraper(BaseScraper):
             if col_input < 0 or col_output < 0:
                 continue
 
+            # One scan over the body pulls (model, input, output) cells per row
+            columns = tuple(sorted({col_model, col_input, col_output}))
+            g_model, g_input, g_output = (
+                columns.index(c) + 1 for c in (col_model, col_input, col_output)
+            )
+            rows = [
+                (m.group(g_model).strip(), m.group(g_input).strip(), m.group(g_output).strip())
+                for m in _md_row_re(columns).finditer(block, sep.end())
+            ]
+            prices = self._batch_extract_numbers([c for _, i, o in rows for c in (i, o)])
             current_model = ''
-            for r in rows[sep_idx + 1:]:
-                cells = [c.strip() for c in r.split('|')[1:-1]]
-                if len(cells) <= max(col_model, col_input, col_output):
-                    continue
-                model_cell = cells[col_model]
+            for n, (model_cell, input_cell, output_cell) in enumerate(rows):
                 if model_cell and not model_cell.startswith('^^'):
                     current_model = model_cell.replace('\\-', '-').strip()
                 if not current_model:
                     continue
-                if '不支持' in (cells[col_input] if col_input < len(cells) else '') or \
-                   '不支持' in (cells[col_output] if col_output < len(cells) else ''):
+                if '不支持' in input_cell or '不支持' in output_cell:
                     continue
-                in_val = self._extract_yuan_from_cell(
-                    cells[col_input] if col_input < len(cells) else '')
-                out_val = self._extract_yuan_from_cell(
-                    cells[col_output] if col_output < len(cells) else '')
+                in_val, out_val = prices[2 * n], prices[2 * n + 1]
                 if in_val <= 0 and out_val <= 0:
                     continue
                 mid = self.model_id_from_name(current_model)
@@ -302,58 +451,42 @@ class DoubaoScraper(BaseScraper):
                     no = cur[2] if cur[2] > 0 else out_val
                     models_dict[mid] = (current_model, ni, no)
 
-        return [
-            self._doubao_model(name, inp, out)
-            for _, (name, inp, out) in models_dict.items()
+        return self._doubao_models(
+            (name, inp, out, mid)
+            for mid, (name, inp, out) in models_dict.items()
             if inp > 0 or out > 0
-        ]
-
-    def _extract_yuan_from_cell(self, cell: str) -> float:
-        """Extract number from cell (e.g. '0.80 ', '2.00', '不支持')."""
-        if not cell or '不支持' in cell:
-            return 0.0
-        m = re.search(r'([\d.]+)', cell)
-        return float(m.group(1)) if m else 0.0
-
-    def _extract_from_loader_data(self, data: Dict) -> List[Dict]:
-        """Fallback: recursively search loaderData for pricing strings."""
-        models = []
-        loader = data.get('loaderData') or {}
+        )
 
-        def search(obj: Any, depth: int = 0) -> None:
+    def _extract_from_loader_data(self, data: Dict) -> List[DoubaoModel]:
+        """Fallback: search loaderData for pricing strings, stopping at the first hit."""
+        models: List[DoubaoModel] = []
+        queue = deque([(data.get('loaderData') or {}, 0)])
+        while queue and not models:
+            obj, depth = queue.popleft()
             if depth > 10:
-                return
-            if isinstance(obj, str) and '|模型名称' in obj and '元' in obj:
-                models.extend(self._parse_markdown_tables(obj))
+                continue
+            if isinstance(obj, str):
+                if '|模型名称' in obj and '元' in obj:
+                    models.extend(self._parse_markdown_tables(obj))
             elif isinstance(obj, dict):
-                for v in obj.values():
-                    search(v, depth + 1)
+                queue.extend((v, depth + 1) for v in obj.values())
             elif isinstance(obj, list):
-                for v in obj:
-                    search(v, depth + 1)
-
-        search(loader)
+                queue.extend((v, depth + 1) for v in obj)
         return models
 
-    def _parse_price_patterns(self, html: str) -> List[Dict]:
+    def _parse_price_patterns(self, html: str) -> List[DoubaoModel]:
         """
         Regex-based extraction for patterns like:
         - 豆包-pro-32k: 0.8元/千tokens 输入, 2.0元/千tokens 输出
         - Model name followed by yuan prices
         """
-        models = []
+        rows_cny = []
         # Pattern: model name (alphanumeric, hyphen) then price info
         # Common: 元/千tokens or 元/万tokens - we need per 1M so: 元/千 = *1000 for 1M
-        pattern = re.compile(
-            r'([a-zA-Z0-9\u4e00-\u9fff\-]+(?:pro|lite|32k|128k)?)\s*[：:]\s*'
-            r'([\d.]+)\s*元[\/／]?[^\d]*[\d]*\s*[千万]?token[^,，]*[，,]?\s*'
-            r'([\d.]+)\s*元[\/／]?[^\d]*[\d]*\s*[千万]?token',
-            re.IGNORECASE
-        )
-        for m in pattern.finditer(html):
+        for m in _PRICE_PATTERN_RE.finditer(html):
             name, in_yuan, out_yuan = m.groups()
             in_cny = float(in_yuan)
             out_cny = float(out_yuan)
             if in_cny > 0 or out_cny > 0:
-                models.append(self._doubao_model(name.strip(), in_cny, out_cny))
-        return models
+                rows_cny.append((name.strip(), in_cny, out_cny, None))
+        return self._doubao_models(rows_cny)
@@ -1,17 +1,29 @@
 """
 Currency exchange rate lookup using forex-python.
-Runs on each scrape to get dynamic CNY->USD rate.
+The CNY->USD rate is cached in data/forex_cache.json for a few hours
+(rates barely move intraday), and in memory with the same expiry.
 """
-from typing import Optional
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Tuple
+import json
 import logging
+import os
+import time
 
 logger = logging.getLogger(__name__)
 
 # Fallback when API fails
 CNY_TO_USD_FALLBACK = 1 / 7.2
 
+FOREX_CACHE_PATH = Path('data') / 'forex_cache.json'
+FOREX_CACHE_TTL = 6 * 3600  # seconds
 
-def get_cny_to_usd() -> float:
+# In-process layer over the disk cache: (cache path, ttl) -> (rate, expires_at epoch)
+_memory_cache: Dict[Tuple[Path, int], Tuple[float, float]] = {}
+
+
+def _fetch_cny_to_usd() -> float:
     """
     Fetch current CNY to USD rate (how many USD per 1 CNY).
     Falls back to ~1/7.2 if forex-python unavailable or API fails.
@@ -29,3 +41,63 @@ def get_cny_to_usd() -> float:
     except Exception as e:
         logger.warning(f"Forex API failed ({e}); using fallback CNY rate")
     return CNY_TO_USD_FALLBACK
+
+
+def _read_cached_rate(cache_path: Path, ttl_seconds: int) -> Tuple[float, float]:
+    """Return (cached rate, seconds until it expires), or (0.0, 0.0) if stale or missing."""
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        age = (datetime.utcnow() - datetime.fromisoformat(cached['fetched_at'])).total_seconds()
+        if 0 <= age < ttl_seconds and cached['cny_to_usd'] > 0:
+            logger.info(f"Using cached forex rate from {cached['fetched_at']}")
+            return cached['cny_to_usd'], ttl_seconds - age
+    except FileNotFoundError:
+        pass
+    except (ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable forex cache {cache_path}: {e}")
+    return 0.0, 0.0
+
+
+def _write_cached_rate(cache_path: Path, cny_to_usd: float) -> None:
+    """Write the rate atomically so a crash never leaves a torn cache file."""
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_path.with_name(cache_path.name + '.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
+        json.dump({
+            'cny_to_usd': cny_to_usd,
+            'fetched_at': datetime.utcnow().isoformat()
+        }, f, indent=2)
+    os.replace(tmp, cache_path)
+
+
+def get_cny_to_usd(cache_path: Path = FOREX_CACHE_PATH, ttl_seconds: int = FOREX_CACHE_TTL) -> float:
+    """
+    Return the CNY to USD rate (how many USD per 1 CNY), reusing the cached
+    rate (in memory, else on disk) while it is younger than ttl_seconds.
+    Falls back to ~1/7.2 if forex-python unavailable or API fails.
+    
+    Args:
+        cache_path: JSON cache file (default data/forex_cache.json)
+        ttl_seconds: Maximum age of the cached rate (default 6h)
+    """
+    now = time.time()
+    key = (cache_path, ttl_seconds)
+    rate, expires_at = _memory_cache.get(key, (0.0, 0.0))
+    if rate and now < expires_at:
+        return rate
+
+    cny_to_usd, remaining = _read_cached_rate(cache_path, ttl_seconds)
+    if cny_to_usd:
+        _memory_cache[key] = (cny_to_usd, now + remaining)
+        return cny_to_usd
+
+    cny_to_usd = _fetch_cny_to_usd()
+    # Only cache real quotes; a failed lookup should be retried next call
+    if cny_to_usd != CNY_TO_USD_FALLBACK:
+        _memory_cache[key] = (cny_to_usd, now + ttl_seconds)
+        try:
+            _write_cached_rate(cache_path, cny_to_usd)
+        except OSError as e:
+            logger.warning(f"Could not write forex cache {cache_path}: {e}")
+    return cny_to_usd
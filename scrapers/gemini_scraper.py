@@ -3,10 +3,21 @@
 Scraper for Google Gemini pricing.
 Parses https://ai.google.dev/gemini-api/docs/pricing
 """
-from typing import Dict, List, Optional, Tuple
-from bs4 import BeautifulSoup, Tag
+from typing import Dict, List, Tuple
+from lxml import etree, html
 
-from .base_scraper import BaseScraper, logger
+from .base_scraper import BaseScraper, Model, logger, stripped_text
+
+# XPath expressions compiled once at import time
+# Model h2s (id contains "gemini", any case), tab groups and pricing tables,
+# returned together in document order
+_SECTION_NODES = etree.XPath(
+    '//h2[contains(translate(@id, "GEMINI", "gemini"), "gemini")]'
+    ' | //div[contains(@class, "ds-selector-tabs")]'
+    ' | //table[contains(concat(" ", normalize-space(@class), " "), " pricing-table ")]'
+)
+_MODEL_CODE = etree.XPath('following-sibling::em[1]//code')
+_MODELS_SECTION = etree.XPath('ancestor::div[contains(@class, "models-section")][1]')
 
 
 class GeminiScraper(BaseScraper):
@@ -25,63 +36,37 @@ class GeminiScraper(BaseScraper):
         """
         logger.info(f"Scraping {self.provider_name} pricing...")
 
-        soup = self.fetch_page(self.base_url)
-        if not soup:
+        root = self.fetch_tree(self.base_url)
+        if root is None:
             logger.error(f"Failed to fetch {self.provider_name} pricing page")
             return self.format_output([])
 
-        models = self._parse_model_sections(soup)
+        models = self._parse_model_sections(root)
         return self.format_output(models)
 
-    def _parse_model_sections(self, soup: BeautifulSoup) -> List[Dict]:
+    def _parse_model_sections(self, root: html.HtmlElement) -> List[Model]:
         """
         Find models-section divs and their associated Standard pricing tables.
         Each model has: heading-group (h2 + code) and a following ds-selector-tabs with Standard table.
+        The h2 -> tabs -> table mapping is built in one walk over the document.
         """
         models = []
         seen_ids = set()
 
-        # Find all model heading groups (h2 with id like gemini-*)
-        model_headers = soup.find_all('h2', id=lambda x: x and 'gemini' in (x or '').lower())
+        model_headers, tabs_for, std_tables = self._index_sections(root)
         for h2 in model_headers:
-            model_name = (h2.get('data-text') or h2.get_text(strip=True)).strip()
-            code = h2.find_next_sibling('em')
-            model_id = ''
-            if code and code.find('code'):
-                model_id = code.find('code').get_text(strip=True)
+            model_name = (h2.get('data-text') or stripped_text(h2)).strip()
+            codes = _MODEL_CODE(h2)
+            model_id = stripped_text(codes[0]) if codes else ''
             if not model_id:
                 model_id = self.model_id_from_name(model_name)
 
             if model_id in seen_ids:
                 continue
 
-            # Find ds-selector-tabs: sibling of models-section, or next in document
-            models_section = h2.find_parent('div', class_=lambda c: c and 'models-section' in c)
-            tabs = None
-            if models_section:
-                sib = models_section.find_next_sibling()
-                while sib:
-                    if isinstance(sib, Tag) and sib.get('class') and 'ds-selector-tabs' in sib.get('class', []):
-                        tabs = sib
-                        break
-                    sib = sib.find_next_sibling()
-            if not tabs:
-                tabs = h2.find_next('div', class_=lambda c: c and 'ds-selector-tabs' in (c or []))
-
-            if not tabs:
-                continue
-
-            std_table = None
-            for sec in tabs.find_all('section', recursive=True):
-                h3 = sec.find('h3')
-                if h3 and 'standard' in (h3.get_text(strip=True) or '').lower():
-                    std_table = sec.find('table', class_='pricing-table')
-                    if std_table:
-                        break
-            if not std_table:
-                std_table = tabs.find('table', class_='pricing-table')
-
-            if not std_table:
+            tabs = tabs_for.get(h2)
+            std_table = std_tables.get(tabs) if tabs is not None else None
+            if std_table is None:
                 continue
 
             input_price, output_price, context = self._parse_gemini_table(std_table)
@@ -93,35 +78,101 @@ class GeminiScraper(BaseScraper):
                     continue
 
             seen_ids.add(model_id)
-            models.append({
-                'model_name': model_name,
-                'model_id': model_id,
-                'input_price_per_mtok': round(input_price, 4),
-                'output_price_per_mtok': round(output_price, 4),
-                'context_window': context or 1000000,
-                'notes': 'Standard tier; prompts <= 200k'
-            })
+            models.append(Model(
+                model_name=model_name,
+                model_id=model_id,
+                input_price_per_mtok=round(input_price, 4),
+                output_price_per_mtok=round(output_price, 4),
+                context_window=context or 1000000,
+                notes='Standard tier; prompts <= 200k'
+            ))
 
         return models
 
-    def _parse_gemini_table(self, table: Tag) -> Tuple[float, float, int]:
-        """Extract input and output price from a Gemini pricing-table. Third column is Paid Tier."""
+    @staticmethod
+    def _index_sections(root: html.HtmlElement) -> Tuple[
+        List[html.HtmlElement], Dict[html.HtmlElement, html.HtmlElement],
+        Dict[html.HtmlElement, html.HtmlElement]
+    ]:
+        """
+        Single document-order walk over the model h2s, tab groups and
+        pricing tables (selected by one precompiled XPath).
+        
+        Returns:
+            (model h2s with a gemini-* id,
+             h2 -> its ds-selector-tabs: the first tabs sibling after the h2's
+             models-section, else the next tabs in the document,
+             tabs -> its Standard pricing-table, else its first pricing-table)
+        """
+        model_headers = []
+        section_of = {}   # h2 -> enclosing models-section div
+        tabs_after = {}   # models-section -> first following sibling tabs
+        next_tabs = {}    # h2 -> next tabs in document order
+        pending = []      # h2s still waiting for their next tabs
+        tables = {}       # tabs -> pricing-tables inside it, in order
+
+        for el in _SECTION_NODES(root):
+            if el.tag == 'h2':
+                model_headers.append(el)
+                pending.append(el)
+                sections = _MODELS_SECTION(el)
+                if sections:
+                    section_of[el] = sections[0]
+            elif el.tag == 'div':
+                for h2 in pending:
+                    next_tabs[h2] = el
+                pending.clear()
+                tables[el] = []
+                for sib in el.itersiblings(preceding=True):
+                    if 'ds-selector-tabs' in (sib.get('class') or ''):
+                        break
+                    tabs_after[sib] = el
+            else:
+                for anc in el.iterancestors('div'):
+                    if anc in tables:
+                        tables[anc].append(el)
+                        break
+
+        tabs_for = {}
+        for h2 in model_headers:
+            tabs = tabs_after.get(section_of.get(h2))
+            if tabs is None:
+                tabs = next_tabs.get(h2)
+            if tabs is not None:
+                tabs_for[h2] = tabs
+
+        std_tables = {}
+        for tabs, found in tables.items():
+            if not found:
+                continue
+            std_tables[tabs] = found[0]
+            for table in found:
+                sec = next((a for a in table.iterancestors() if a is tabs or a.tag == 'section'), tabs)
+                h3 = sec.find('.//h3') if sec is not tabs else None
+                if h3 is not None and 'standard' in stripped_text(h3).lower():
+                    std_tables[tabs] = table
+                    break
+
+        return model_headers, tabs_for, std_tables
+
+    def _parse_gemini_table(self, table: html.HtmlElement) -> Tuple[float, float, int]:
+        """
+        Extract input and output price from a Gemini pricing-table. Third column is Paid Tier.
+        Only the two price rows have their paid cell parsed.
+        """
         input_price = 0.0
         output_price = 0.0
-        context = 0
 
-        for tr in (table.find('tbody') or table).find_all('tr'):
-            cells = tr.find_all('td')
+        tbody = table.find('.//tbody')
+        for tr in (tbody if tbody is not None else table).iter('tr'):
+            cells = tr.findall('td')
             if len(cells) < 3:
                 continue
-            label = cells[0].get_text(strip=True).lower()
-            paid_cell = cells[2].get_text()
-            val = self.normalize_price(paid_cell)
+            label = stripped_text(cells[0]).lower()
             if 'input price' in label and 'output' not in label:
-                input_price = val
+                input_price = self.normalize_price(cells[2].text_content())
             elif 'output price' in label:
-                output_price = val
-            if '200k' in paid_cell.lower() or '200k' in label:
-                context = max(context, self.parse_context_window('200K'))
+                output_price = self.normalize_price(cells[2].text_content())
 
-        return input_price, output_price, context or 200000
+        # Standard-tier prices are quoted for prompts <= 200k tokens
+        return input_price, output_price, 200000
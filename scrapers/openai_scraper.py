@@ -4,9 +4,9 @@ Scraper for OpenAI pricing.
 Parses https://developers.openai.com/api/docs/pricing
 """
 from typing import Dict, List
-from bs4 import BeautifulSoup
+from lxml import html
 
-from .base_scraper import BaseScraper, logger
+from .base_scraper import BaseScraper, Model, logger, stripped_text
 
 
 class OpenAIScraper(BaseScraper):
@@ -25,15 +25,15 @@ class OpenAIScraper(BaseScraper):
         """
         logger.info(f"Scraping {self.provider_name} pricing...")
 
-        soup = self.fetch_page(self.base_url)
-        if not soup:
+        root = self.fetch_tree(self.base_url)
+        if root is None:
             logger.error(f"Failed to fetch {self.provider_name} pricing page")
             return self.format_output([])
 
-        models = self._parse_pricing_tables(soup)
+        models = self._parse_pricing_tables(root)
         return self.format_output(models)
 
-    def _parse_pricing_tables(self, soup: BeautifulSoup) -> List[Dict]:
+    def _parse_pricing_tables(self, root: html.HtmlElement) -> List[Model]:
         """
         Find the Text tokens pricing table. Prefer Standard tier (default).
         Parse all model rows dynamically from tables with Model | Input | Output columns.
@@ -42,30 +42,31 @@ class OpenAIScraper(BaseScraper):
         seen_model_ids = set()
 
         # Try Standard pane first (data-content-switcher-initial="standard")
-        pane = soup.find('div', attrs={'data-content-switcher-pane': 'standard'})
-        if not pane:
+        panes = root.xpath('//div[@data-content-switcher-pane="standard"]')
+        pane = panes[0] if panes else None
+        if pane is None:
             # Fallback: find any pane without hidden that contains a table
-            for div in soup.find_all('div', attrs={'data-content-switcher-pane': True}):
-                if div.get('hidden') is None and div.find('table'):
+            for div in root.xpath('//div[@data-content-switcher-pane]'):
+                if div.get('hidden') is None and div.find('.//table') is not None:
                     pane = div
                     break
 
-        tables = [pane.find('table')] if pane else []
-        if not tables or not tables[0]:
+        tables = [pane.find('.//table')] if pane is not None else []
+        if not tables or tables[0] is None:
             # Fallback: any table with Model, Input, Output headers
-            tables = soup.find_all('table')
+            tables = root.xpath('//table')
 
         for table in tables:
-            if not table:
+            if table is None:
                 continue
 
-            thead = table.find('thead')
-            if not thead:
+            thead = table.find('.//thead')
+            if thead is None:
                 continue
 
-            headers = [th.get_text(strip=True).lower() for th in thead.find_all('th')]
+            headers = [stripped_text(th).lower() for th in thead.iter('th')]
             header_text = ' '.join(headers)
-            if 'input' not in header_text or 'output' not in header_text or 'model' not in header_text:
+            if not all(k in header_text for k in ('model', 'input', 'output')):
                 continue
 
             col_model = 0
@@ -86,16 +87,16 @@ class OpenAIScraper(BaseScraper):
             if col_output is None or col_output < 0:
                 continue
 
-            tbody = table.find('tbody')
-            if not tbody:
+            tbody = table.find('.//tbody')
+            if tbody is None:
                 continue
 
-            for tr in tbody.find_all('tr'):
-                cells = tr.find_all('td')
+            for tr in tbody.iter('tr'):
+                cells = tr.findall('td')
                 if len(cells) <= max(col_model, col_input, col_output):
                     continue
 
-                model_name = cells[col_model].get_text(strip=True)
+                model_name = stripped_text(cells[col_model])
                 if not model_name or len(model_name) < 2:
                     continue
 
@@ -104,27 +105,26 @@ class OpenAIScraper(BaseScraper):
                     continue
                 seen_model_ids.add(model_id)
 
-                input_price = self.normalize_price(cells[col_input].get_text())
-                output_price = self.normalize_price(cells[col_output].get_text())
+                input_price = self.normalize_price(cells[col_input].text_content())
+                output_price = self.normalize_price(cells[col_output].text_content())
 
                 if input_price == 0 and output_price == 0:
                     continue
 
                 notes = 'Standard tier'
-                cached_cell = table.find('th', string=lambda t: t and 'cached' in t.lower()) if table else None
                 if col_input + 1 < len(cells) and 'cached' in header_text:
-                    cached_val = cells[col_input + 1].get_text(strip=True)
+                    cached_val = stripped_text(cells[col_input + 1])
                     if cached_val and cached_val not in ('-', '—'):
                         notes = f'Standard tier; cached input: ${self.normalize_price(cached_val)}/MTok'
 
-                models.append({
-                    'model_name': model_name,
-                    'model_id': model_id,
-                    'input_price_per_mtok': round(input_price, 4),
-                    'output_price_per_mtok': round(output_price, 4),
-                    'context_window': 128000,  # OpenAI typical
-                    'notes': notes
-                })
+                models.append(Model(
+                    model_name=model_name,
+                    model_id=model_id,
+                    input_price_per_mtok=round(input_price, 4),
+                    output_price_per_mtok=round(output_price, 4),
+                    context_window=128000,  # OpenAI typical
+                    notes=notes
+                ))
 
             if models:
                 break